@@ -77,7 +77,7 @@ def backpropagate(variable: Variable, deriv: Any) -> None:
     raise NotImplementedError("Need to include this file from past assignment.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """Context class is used by `Function` to store information during the forward pass."""
 
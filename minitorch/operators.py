@@ -32,6 +32,47 @@ from typing import Callable, Iterable
 # $f(x) = |x - y| < 1e-2$
 
 
+def sigmoid(x: float) -> float:
+    """Sigmoid function, computed in a numerically stable form."""
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    e = math.exp(x)
+    return e / (1.0 + e)
+
+
+def relu(x: float) -> float:
+    """ReLU function $f(x) = max(x, 0)$."""
+    return x if x > 0 else 0.0
+
+
+def log(x: float) -> float:
+    """Natural logarithm."""
+    return math.log(x)
+
+
+def exp(x: float) -> float:
+    """Exponential function."""
+    return math.exp(x)
+
+
+def inv(x: float) -> float:
+    """Reciprocal $f(x) = 1/x$."""
+    return 1.0 / x
+
+
+def log_back(x: float, d: float) -> float:
+    """Derivative of log times a second arg."""
+    return d / x
+
+
+def inv_back(x: float, d: float) -> float:
+    """Derivative of reciprocal times a second arg."""
+    return -d / (x * x)
+
+
+def relu_back(x: float, d: float) -> float:
+    """Derivative of ReLU times a second arg."""
+    return d if x > 0 else 0.0
 
 
 # ## Task 0.3
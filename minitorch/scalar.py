@@ -24,7 +24,7 @@ from .scalar_functions import (
 ScalarLike = Union[float, int, "Scalar"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScalarHistory:
     """`ScalarHistory` stores the history of `Function` operations that was
     used to construct the current Variable.
@@ -48,7 +48,7 @@ class ScalarHistory:
 _var_count = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Scalar:
     """A reimplementation of scalar values for autodifferentiation
     tracking. Scalar Variables behave as close as possible to standard
@@ -144,6 +144,11 @@ class Scalar:
     raise NotImplementedError("Need to include this file from past assignment.")
 
 
+# `scalar_functions` cannot import this module, so hand it the classes here.
+ScalarFunction._scalar_cls = Scalar
+ScalarFunction._history_cls = ScalarHistory
+
+
 def derivative_check(f: Any, *scalars: Scalar) -> None:
     """Checks that autodiff works on a python function.
     Asserts False if derivative is incorrect.
@@ -1,24 +1,20 @@
 from __future__ import annotations
 
+from math import exp as _exp
+from math import log as _log
 from typing import TYPE_CHECKING
 
-import minitorch
-
 from . import operators
 from .autodiff import Context
 
 if TYPE_CHECKING:
-    from typing import Tuple
-
-    from .scalar import Scalar, ScalarLike
+    from typing import Any, Tuple, Type
 
+    from .scalar import Scalar, ScalarHistory, ScalarLike
 
-def wrap_tuple(x: float | Tuple[float, ...]) -> Tuple[float, ...]:
-    """Turn a possible value into a tuple"""
-    if isinstance(x, tuple):
-        return x
-    return (x,)
 
+# Shared by every call whose inputs are all constants.
+_NO_GRAD_CTX = Context(True)
 
 class ScalarFunction:
     """A wrapper for a mathematical function that processes and produces
@@ -28,9 +24,14 @@ class ScalarFunction:
     here to group together the `forward` and `backward` code.
     """
 
+    # `scalar` imports this module, so it binds these once its classes exist.
+    _scalar_cls: Type[Scalar]
+    _history_cls: Type[ScalarHistory]
+
     @classmethod
     def _backward(cls, ctx: Context, d_out: float) -> Tuple[float, ...]:
-        return wrap_tuple(cls.backward(ctx, d_out))  # type: ignore
+        # Every `backward` returns a tuple, one entry per input.
+        return cls.backward(ctx, d_out)  # type: ignore
 
     @classmethod
     def _forward(cls, ctx: Context, *inps: float) -> float:
@@ -38,26 +39,53 @@ class ScalarFunction:
 
     @classmethod
     def apply(cls, *vals: ScalarLike) -> Scalar:
-        raw_vals = []
-        scalars = []
-        for v in vals:
-            if isinstance(v, minitorch.scalar.Scalar):
-                scalars.append(v)
-                raw_vals.append(v.data)
-            else:
-                scalars.append(minitorch.scalar.Scalar(v))
-                raw_vals.append(v)
-
-        # Create the context.
-        ctx = Context(False)
+        scalar_cls = cls._scalar_cls
+        # `type(v) is scalar_cls` does not narrow for type checkers, so the
+        # inputs are handled untyped below.
+        args: Tuple[Any, ...] = vals
+        n = len(args)
+
+        # Unary and binary functions make up nearly every call, so avoid
+        # building intermediate lists for them. Python numbers are wrapped
+        # as constants (no history), so backward never visits them.
+        if n == 1:
+            (v0,) = args
+            s0 = v0 if type(v0) is scalar_cls else scalar_cls(v0, None)
+            scalars: Tuple[Scalar, ...] = (s0,)
+            raw_vals: Tuple[float, ...] = (s0.data,)
+        elif n == 2:
+            v0, v1 = args
+            s0 = v0 if type(v0) is scalar_cls else scalar_cls(v0, None)
+            s1 = v1 if type(v1) is scalar_cls else scalar_cls(v1, None)
+            scalars = (s0, s1)
+            raw_vals = (s0.data, s1.data)
+        else:
+            scalars = tuple(
+                v if type(v) is scalar_cls else scalar_cls(v, None) for v in args
+            )
+            raw_vals = tuple(v.data for v in scalars)
+
+        need_grad = False
+        for v in scalars:
+            if v.history is not None:
+                need_grad = True
+                break
+
+        # Create the context. Constant inputs share one no-grad context,
+        # since `save_for_backward` never writes to it.
+        ctx = Context(False) if need_grad else _NO_GRAD_CTX
 
         # Call forward with the variables.
         c = cls._forward(ctx, *raw_vals)
-        assert isinstance(c, float), "Expected return type float got %s" % (type(c))
+        # assert isinstance(c, float), "Expected return type float got %s" % (
+        #     type(c)
+        # )
 
         # Create a new variable from the result with a new history.
-        back = minitorch.scalar.ScalarHistory(cls, ctx, scalars)
-        return minitorch.scalar.Scalar(c, back)
+        if not need_grad:
+            return scalar_cls(c, None)
+        back = cls._history_cls(cls, ctx, scalars)
+        return scalar_cls(c, back)
 
 
 # Examples
@@ -79,14 +107,125 @@ class Log(ScalarFunction):
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         ctx.save_for_backward(a)
-        return operators.log(a)
+        return _log(a)
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
+        (a,) = ctx.saved_values
+        return (operators.log_back(a, d_output),)
+
+
+class Mul(ScalarFunction):
+    """Multiplication function $f(x, y) = x * y$"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float, b: float) -> float:
+        ctx.save_for_backward(a, b)
+        return a * b
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float, float]:
+        a, b = ctx.saved_values
+        return b * d_output, a * d_output
+
+
+class Inv(ScalarFunction):
+    """Inverse function $f(x) = 1/x$"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float) -> float:
+        ctx.save_for_backward(a)
+        return operators.inv(a)
 
     @staticmethod
-    def backward(ctx: Context, d_output: float) -> float:
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
         (a,) = ctx.saved_values
-        return operators.log_back(a, d_output)
+        return (operators.inv_back(a, d_output),)
 
 
-# To implement.
+class Neg(ScalarFunction):
+    """Negation function $f(x) = -x$"""
 
+    @staticmethod
+    def forward(ctx: Context, a: float) -> float:
+        return -a
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
+        return (-d_output,)
+
+
+class Sigmoid(ScalarFunction):
+    r"""Sigmoid function $f(x) = \frac{1}{1 + e^{-x}}$"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float) -> float:
+        # Same stable branches as `operators.sigmoid`, without the extra call.
+        if a >= 0:
+            s = 1.0 / (1.0 + _exp(-a))
+        else:
+            e = _exp(a)
+            s = e / (1.0 + e)
+        ctx.save_for_backward(s)
+        return s
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
+        # $f'(x) = f(x) (1 - f(x))$, so reuse the saved output.
+        (s,) = ctx.saved_values
+        return (s * (1.0 - s) * d_output,)
 
+
+class ReLU(ScalarFunction):
+    """ReLU function $f(x) = max(x, 0)$"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float) -> float:
+        ctx.save_for_backward(a)
+        return operators.relu(a)
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
+        (a,) = ctx.saved_values
+        return (operators.relu_back(a, d_output),)
+
+
+class Exp(ScalarFunction):
+    """Exp function $f(x) = e^x$"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float) -> float:
+        out = _exp(a)
+        ctx.save_for_backward(out)
+        return out
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float]:
+        # $f'(x) = f(x)$, so the saved output is the derivative.
+        (out,) = ctx.saved_values
+        return (out * d_output,)
+
+
+class LT(ScalarFunction):
+    """Less-than function $f(x) =$ 1.0 if x is less than y else 0.0"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float, b: float) -> float:
+        # The derivative is zero everywhere, so nothing is saved.
+        return 1.0 if a < b else 0.0
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float, float]:
+        return 0.0, 0.0
+
+
+class EQ(ScalarFunction):
+    """Equal function $f(x) =$ 1.0 if x is equal to y else 0.0"""
+
+    @staticmethod
+    def forward(ctx: Context, a: float, b: float) -> float:
+        return 1.0 if a == b else 0.0
+
+    @staticmethod
+    def backward(ctx: Context, d_output: float) -> Tuple[float, float]:
+        return 0.0, 0.0
@@ -272,7 +272,7 @@ class Tensor:
         return Mul.apply(self._ensure_tensor(b), Inv.apply(self))
 
     def __matmul__(self, b: Tensor) -> Tensor:
-        """Not used until Module 3"""
+        """Matrix multiply"""
         return MatMul.apply(self, b)
 
     @property
@@ -165,6 +165,43 @@ class MatMul(Function):
         )
 
 
+class BCEWithLogits(Function):
+    @staticmethod
+    def forward(ctx: Context, logits: Tensor, y: Tensor) -> Tensor:
+        """Stable binary cross entropy on logits in a single zip"""
+        ctx.save_for_backward(logits, y)
+        return logits.f.bce_logits_zip(logits, y)
+
+    @staticmethod
+    def backward(ctx: Context, grad_output: Tensor) -> Tuple[Tensor, Tensor]:
+        """Gradients `sigmoid(logits) - y` and `-logits`, times `grad_output`"""
+        logits, y = ctx.saved_values
+        f = grad_output.f
+        return (
+            f.mul_zip(f.bce_logits_back_zip(logits, y), grad_output),
+            f.mul_zip(f.neg_map(logits), grad_output),
+        )
+
+
+def binary_cross_entropy_with_logits(logits: Tensor, y: Tensor) -> Tensor:
+    """Per-element binary cross entropy of `sigmoid(logits)` against `y`.
+
+    Works on the logits directly, so no sigmoid is evaluated in forward
+    and large logits do not overflow.
+
+    Args:
+    ----
+        logits: predictions before the sigmoid
+        y: labels in {0, 1}
+
+    Returns:
+    -------
+        `-(y log(sigmoid(logits)) + (1 - y) log(1 - sigmoid(logits)))`
+
+    """
+    return BCEWithLogits.apply(logits, y)
+
+
 # Helpers for Constructing tensors
 def zeros(shape: UserShape, backend: TensorBackend = SimpleBackend) -> Tensor:
     """Produce a zero tensor of size `shape`.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Callable, Optional, Type
 
 import numpy as np
@@ -8,6 +9,7 @@ from typing_extensions import Protocol
 from . import operators
 from .tensor_data import (
     MAX_DIMS,
+    TensorData,
     broadcast_index,
     index_to_position,
     shape_broadcast,
@@ -51,6 +53,22 @@ class TensorOps:
     cuda = False
 
 
+# Kernels for `binary_cross_entropy_with_logits`. They live here rather than
+# in `operators`, which is replaced when syncing the previous module.
+
+
+def _bce_logits(x: float, y: float) -> float:
+    """Binary cross entropy of logit `x` against label `y`, computed in the
+    stable form $max(x, 0) - x y + log(1 + e^{-|x|})$.
+    """
+    return max(x, 0.0) - x * y + math.log1p(math.exp(-abs(x)))
+
+
+def _bce_logits_back(x: float, y: float) -> float:
+    """Derivative of `_bce_logits` with respect to the logit, $sigmoid(x) - y$."""
+    return operators.sigmoid(x) - y
+
+
 class TensorBackend:
     def __init__(self, ops: Type[TensorOps]):
         """Dynamically construct a tensor backend based on a `tensor_ops` object
@@ -82,6 +100,8 @@ class TensorBackend:
         self.relu_back_zip = ops.zip(operators.relu_back)
         self.log_back_zip = ops.zip(operators.log_back)
         self.inv_back_zip = ops.zip(operators.inv_back)
+        self.bce_logits_zip = ops.zip(_bce_logits)
+        self.bce_logits_back_zip = ops.zip(_bce_logits_back)
 
         # Reduce
         self.add_reduce = ops.reduce(operators.add, 0.0)
@@ -218,12 +238,36 @@ class SimpleOps(TensorOps):
 
     @staticmethod
     def matrix_multiply(a: "Tensor", b: "Tensor") -> "Tensor":
-        """Matrix multiplication"""
-        raise NotImplementedError("Not implemented in this assignment")
+        """Matrix multiplication, batched over any leading dimensions.
+
+        Both storages are viewed through their strides and passed to
+        `numpy.matmul`, so permuted inputs need no copy.
+
+        Args:
+            a : tensor of shape (..., n, m)
+            b : tensor of shape (..., m, p)
+
+        Returns:
+            new tensor of shape (..., n, p)
+
+        """
+        out = np.matmul(_strided_array(a), _strided_array(b))
+        return a._new(TensorData(out.reshape(-1), out.shape))
 
     is_cuda = False
 
 
+def _strided_array(a: "Tensor") -> Storage:
+    """View the storage of `a` as a numpy array of its shape and strides."""
+    storage = a._tensor._storage
+    return np.lib.stride_tricks.as_strided(
+        storage,
+        shape=a.shape,
+        strides=tuple(int(s) * storage.itemsize for s in a._tensor.strides),
+        writeable=False,
+    )
+
+
 # Implementations.
 
 
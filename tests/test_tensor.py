@@ -1,10 +1,17 @@
+import math
 from typing import Callable, Iterable, List, Tuple
 
 import pytest
 from hypothesis import given
 from hypothesis.strategies import DataObject, data, lists, permutations
 
-from minitorch import MathTestVariable, Tensor, grad_check, tensor
+from minitorch import (
+    MathTestVariable,
+    Tensor,
+    binary_cross_entropy_with_logits,
+    grad_check,
+    tensor,
+)
 
 from .strategies import assert_close, small_floats
 from .tensor_strategies import shaped_tensors, tensors
@@ -225,3 +232,31 @@ def test_reduce_forward_all_dims() -> None:
     t_summed_all_expected = tensor([27])
 
     assert_close(t_summed_all[0], t_summed_all_expected[0])
+
+
+@given(shaped_tensors(2))
+def test_binary_cross_entropy_with_logits(ts: Tuple[Tensor, Tensor]) -> None:
+    """Test the logit loss against -log of the sigmoid probability"""
+    t1, t2 = ts
+    t3 = binary_cross_entropy_with_logits(t1, t2)
+    for ind in t3._tensor.indices():
+        x, y = t1[ind], t2[ind]
+        expected = max(x, 0.0) - x * y + math.log1p(math.exp(-abs(x)))
+        assert_close(t3[ind], expected)
+    grad_check(binary_cross_entropy_with_logits, t1, t2)
+
+
+def test_matmul() -> None:
+    """Test matrix multiply, including permuted (non-contiguous) inputs"""
+    a = tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    b = tensor([[1.0, 0.0], [0.0, 1.0], [2.0, -1.0]])
+    c = a @ b
+    assert c.shape == (2, 2)
+    for ind, v in [((0, 0), 7.0), ((0, 1), -1.0), ((1, 0), 16.0), ((1, 1), -1.0)]:
+        assert_close(c[ind], v)
+
+    c_t = b.permute(1, 0) @ a.permute(1, 0)
+    for ind in c_t._tensor.indices():
+        assert_close(c_t[ind], c[ind[1], ind[0]])
+
+    grad_check(lambda x, y: x @ y, a, b)